@@ -6,10 +6,6 @@ with proper error handling and configuration management.
 """
 
 import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src import AgentError, BasicAgent, ConfigurationError, ModelError, load_config
 from src.models import select_and_initialize_model
@@ -39,7 +35,7 @@ def main() -> None:
         print(f"Agent error: {e}")
         sys.exit(1)
     except KeyboardInterrupt:
-        print("\\nShutdown requested by user.")
+        print("\nShutdown requested by user.")
     except Exception as e:
         print(f"Unexpected error: {e}")
         sys.exit(1)
@@ -1,21 +1,104 @@
 """Main agent implementation with modular architecture."""
 
+import asyncio
+import io
+import json
 import os
-from typing import Any
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import lmstudio as lms
 
+try:
+    import readline  # noqa: F401  Line editing and history for input()
+except ImportError:  # Not available on all platforms
+    pass
+
 from .config import AgentConfig
 from .dev_mode import DevModeTracker, is_dev_mode_enabled
 from .exceptions import AgentError, ToolError, UserCancellationError
 from .memory import MemoryManager
 from .models import get_model_info
-from .tools import AVAILABLE_TOOLS
+from .semantic_cache import SemanticResponseCache
+from .tools import AVAILABLE_TOOLS, RecallMemoryTool
+
+# Compiled once at import time; these run on every tool-call parse
+_TOOL_CALL_RE = re.compile(r"TOOL_CALL:\s*(\w+)\(([^)]*)\)")
+_ARG_RE = re.compile(r"(\w+)=([\"'])(.*?)\2")
+
+# Streamed fragments starting with these prefixes are tool-call metadata, not text
+_TOOL_META_PREFIXES = ("ToolCallRequestData", "ToolCallResultData")
+
+# Commands that end the interaction loop
+_EXIT_CMDS = frozenset({"quit", "exit", "bye"})
+
+
+# Extractors specialized per message type, built lazily on first sight; the
+# SDK emits a small fixed set of types, so after warmup this is one dict lookup
+_MSG_EXTRACTORS: dict[type, Any] = {}
+
+
+def _make_extractor(message: object):
+    """Inspect a message's shape once and return a specialized extractor."""
+    if isinstance(message, str):
+        return lambda m: (m,)
+
+    content = getattr(message, "content", None)
+    if content is None:
+        return lambda m: ()
+
+    if isinstance(content, str):
+        return lambda m: (m.content,)
+
+    if hasattr(content, "__iter__"):
+        def extract_items(m: object):
+            for item in m.content:
+                yield item.text if hasattr(item, "text") else str(item)
+
+        return extract_items
+
+    return lambda m: (str(m.content),)
+
+
+def _extract_texts(message: object):
+    """Yield text fragments from a streamed LLM message.
+
+    Handles the message shapes the lmstudio SDK emits: plain strings,
+    messages with string content, and messages with iterable content items.
+    Dispatch is cached by message type so repeated chunks skip the probing.
+    """
+    extractor = _MSG_EXTRACTORS.get(type(message))
+    if extractor is None:
+        extractor = _MSG_EXTRACTORS.setdefault(type(message), _make_extractor(message))
+    return extractor(message)
+
+
+def _parse_tool_args(args_str: str) -> dict:
+    """Parse tool arguments from string format."""
+    # Fast path: some models emit a JSON object instead of key="value"
+    stripped = args_str.strip()
+    if stripped.startswith("{"):
+        try:
+            parsed = json.loads(stripped)
+            if isinstance(parsed, dict):
+                return parsed
+        except json.JSONDecodeError:
+            pass  # Fall through to the regex parser
+
+    # Parse key="value" patterns
+    return {key: value for key, quote, value in _ARG_RE.findall(args_str)}
 
 
 class BasicAgent:
     """Main agent class with clean architecture and comprehensive error handling."""
 
+    # Tools that don't mutate state and can safely run concurrently
+    READONLY_TOOLS = frozenset({"read_file", "list_files", "web_search", "recall_memory"})
+
     def __init__(self, llm: lms.LLM, config: AgentConfig, model_key: str):
         """Initialize the agent with configuration and dependencies.
 
@@ -28,14 +111,69 @@ class BasicAgent:
         self.config = config
         self.model_key = model_key
         self.memory = MemoryManager(config.memory_long_term_path, config.memory_short_term_cap)
-        self.tools = dict(AVAILABLE_TOOLS)
-        
+        # Memory is retrieved on demand via a tool rather than injected inline,
+        # so the prompt prefix stays stable as memory grows. recall_memory is
+        # bound to this agent's MemoryManager, so one copy of the shared
+        # registry is unavoidable; the proxy seals the result against mutation.
+        self.tools: Mapping[str, Any] = MappingProxyType(
+            {**AVAILABLE_TOOLS, "recall_memory": RecallMemoryTool(self.memory)}
+        )
+
         # Initialize dev mode
         self.dev_mode = DevModeTracker(enabled=is_dev_mode_enabled())
-        
+        self._dev_commands = {
+            "!tokens": self._show_token_stats,
+            "!memory": self._show_memory_stats,
+            "!clear": self._clear_short_term_memory,
+            "!stats": self._show_detailed_stats,
+            "!cache": self._show_cache_stats,
+            "!help": self._show_dev_help,
+        }
+
         # Detect tool capability
         self.supports_native_tools = self._detect_tool_capability()
 
+        # Precompute the tool catalog and static prompt prefix once so every
+        # turn reuses a byte-identical prefix and only the user/memory tail varies.
+        self._tools_text = "\n".join(
+            f"- {name}: {tool.description}" for name, tool in self.tools.items()
+        )
+        self._static_tool_prompt = self._build_static_tool_prompt()
+
+        # Tool set is fixed after construction; build the callable wrappers once
+        self._tool_functions = self._prepare_tool_functions()
+
+        # Working directory is cached and refreshed once per turn rather
+        # than re-read at every prompt build
+        self._cwd = os.getcwd()
+
+        # Response cache: repeated or near-identical questions against
+        # unchanged memory skip the LLM call entirely. Persisted across
+        # sessions so warm queries avoid cold-start LLM calls.
+        self.sem_cache = SemanticResponseCache(threshold=0.92, max_entries=256)
+        self._response_cache_path = Path(config.memory_long_term_path).with_name(
+            ".response_cache.json"
+        )
+        self.sem_cache.load(self._response_cache_path, self.model_key)
+
+    def _build_static_tool_prompt(self) -> str:
+        """Build the static instruction prefix for prompt-based tool calling."""
+        return f"""You are a helpful AI assistant with access to the following tools:
+
+{self._tools_text}
+
+To use a tool, respond with EXACTLY this format:
+TOOL_CALL: tool_name(argument1="value1", argument2="value2")
+
+For example:
+- To list files: TOOL_CALL: list_files(path="/Users/username/Documents")
+- To run terminal commands: TOOL_CALL: terminal(command="ls -la")
+"""
+
+    def refresh_cwd(self) -> None:
+        """Re-read the cached working directory."""
+        self._cwd = os.getcwd()
+
     def process_user_input(self, user_input: str) -> None:
         """Process a single user input through the agent loop.
 
@@ -46,22 +184,20 @@ class BasicAgent:
             AgentError: If processing fails
         """
         try:
-            # Check for dev commands first
-            if self.dev_mode.enabled and user_input.startswith("!"):
-                self._handle_dev_command(user_input)
-                return
-            
+            # A terminal tool call may have changed the working directory
+            self.refresh_cwd()
+
             # Prepare context with memory
             memory_context = self.memory.get_memory_context()
             
-            # Dev mode: analyze context before processing
+            # Dev mode: cheap context-size accounting before processing; the
+            # full memory breakdown is only computed on demand via !stats
             if self.dev_mode.enabled:
-                context_stats = self.dev_mode.analyze_context(
-                    user_input, memory_context, 
-                    self.memory.short_term_memory, 
-                    self.memory.long_term_memory
+                context_stats = self.dev_mode.quick_context_stats(
+                    len(user_input), len(memory_context)
                 )
-                
+
+
                 # Show context size info
                 print(f"🔧 Context: {context_stats.total_chars} chars (~{context_stats.estimated_tokens} tokens)")
                 
@@ -72,16 +208,25 @@ class BasicAgent:
                 # Log the request
                 self.dev_mode.log_request(context_stats)
             
+            # Check the response cache before paying for an LLM call
+            cache_prompt = f"{user_input}\n{memory_context}"
+            cached_response = self.sem_cache.lookup(cache_prompt)
+            if cached_response is not None:
+                print(f"\nAgent Response: {cached_response}")
+                self.memory.update_memory(user_input, cached_response)
+                return
+
             print("Thinking...")
 
             if self.supports_native_tools:
-                # Use native tool calling for tool-trained models
+                # Native path streams the response to stdout as chunks arrive
                 full_response = self._process_with_native_tools(user_input, memory_context)
             else:
                 # Use prompt-based approach for other models
                 full_response = self._process_with_prompt_tools(user_input, memory_context)
+                print(f"\nAgent Response: {full_response}")
 
-            print(f"\nAgent Response: {full_response}")
+            self.sem_cache.put(cache_prompt, full_response)
 
             # Update memory
             self.memory.update_memory(user_input, full_response)
@@ -94,75 +239,55 @@ class BasicAgent:
             raise AgentError(f"Error processing input: {e}") from e
 
     def _process_with_native_tools(self, user_input: str, memory_context: str) -> str:
-        """Process input using native tool calling for tool-trained models."""
-        full_prompt = f"{user_input}\n{memory_context}" if memory_context else user_input
-        available_tool_functions = self._prepare_tool_functions()
-        
-        # Collect response parts, filtering out tool call metadata
-        response_parts = []
+        """Process input using native tool calling for tool-trained models.
+
+        Memory is not concatenated into the prompt; tool-trained models fetch
+        it on demand through the recall_memory tool, keeping the prompt prefix
+        stable across turns.
+        """
+        full_prompt = user_input
+        available_tool_functions = self._tool_functions
+
+        # Buffer response fragments, filtering out tool call metadata.
+        # StringIO grows its internal buffer geometrically, avoiding
+        # per-fragment list overhead and the final join allocation.
+        response_buf = io.StringIO()
+        write = response_buf.write
+        stdout_write = sys.stdout.write
 
         def on_message(message: object) -> None:
-            """Handle messages from LLM, filtering out tool call metadata."""
-            if hasattr(message, "content"):
-                if isinstance(message.content, str):
-                    if not self._is_tool_metadata(message.content):
-                        response_parts.append(message.content)
-                elif hasattr(message.content, "__iter__"):
-                    for item in message.content:
-                        if hasattr(item, "text"):
-                            text = item.text
-                            if not self._is_tool_metadata(text):
-                                response_parts.append(text)
-                        else:
-                            text = str(item)
-                            if not self._is_tool_metadata(text):
-                                response_parts.append(text)
-                else:
-                    text = str(message.content)
-                    if not self._is_tool_metadata(text):
-                        response_parts.append(text)
-            elif isinstance(message, str):
-                if not self._is_tool_metadata(message):
-                    response_parts.append(message)
+            """Handle messages from LLM, streaming text and filtering tool metadata."""
+            for text in _extract_texts(message):
+                if not text.startswith(_TOOL_META_PREFIXES):
+                    write(text)
+                    # Stream to the user immediately so first output arrives
+                    # at first-token time rather than after full generation
+                    stdout_write(text)
+                    sys.stdout.flush()
 
         # Execute with tools
+        sys.stdout.write("\nAgent Response: ")
+        sys.stdout.flush()
         self.llm.act(
             full_prompt,
             tools=available_tool_functions,
             on_message=on_message,
             max_prediction_rounds=3,
         )
+        sys.stdout.write("\n")
 
-        return "".join(response_parts) if response_parts else "No response generated"
+        return response_buf.getvalue() or "No response generated"
 
     def _process_with_prompt_tools(self, user_input: str, memory_context: str) -> str:
         """Process input using prompt-based tool calling for non-tool-trained models."""
-        import re
-        import json
-        
-        # Create tool descriptions for the prompt
-        tool_descriptions = []
-        for name, tool in self.tools.items():
-            tool_descriptions.append(f"- {name}: {tool.description}")
-        
-        tools_text = "\n".join(tool_descriptions)
-        
-        # Enhanced prompt for tool usage
-        enhanced_prompt = f"""You are a helpful AI assistant with access to the following tools:
-
-{tools_text}
-
-To use a tool, respond with EXACTLY this format:
-TOOL_CALL: tool_name(argument1="value1", argument2="value2")
-
-For example:
-- To list files: TOOL_CALL: list_files(path="/Users/username/Documents")
-- To run terminal commands: TOOL_CALL: terminal(command="ls -la")
-
-Current working directory: {os.getcwd()}
+        # Static prefix is precomputed; only the dynamic tail is built per turn
+        # Memory precedes the user request so unchanged memory extends the
+        # reusable prompt prefix instead of invalidating it
+        enhanced_prompt = f"""{self._static_tool_prompt}
+{f"Context: {memory_context}" if memory_context else ""}
+Current working directory: {self._cwd}
 
 User request: {user_input}
-{f"Context: {memory_context}" if memory_context else ""}
 
 Response:"""
 
@@ -181,70 +306,94 @@ Response:"""
         return self._parse_and_execute_tool_calls(response)
 
     def _parse_and_execute_tool_calls(self, response: str) -> str:
-        """Parse tool calls from LLM response and execute them."""
-        import re
-        import json
-        
-        # Look for TOOL_CALL: patterns
-        tool_call_pattern = r'TOOL_CALL:\s*(\w+)\((.*?)\)'
-        matches = re.findall(tool_call_pattern, response)
-        
-        if not matches:
+        """Parse tool calls from LLM response and execute them.
+
+        Walks the response once: non-tool-call spans are collected as they are
+        passed. Independent read-only tools run concurrently; anything that
+        can mutate state runs serially afterwards. Results are reported in
+        call order regardless of completion order.
+        """
+        calls = []
+        text_parts = []
+        pos = 0
+
+        for match in _TOOL_CALL_RE.finditer(response):
+            text_parts.append(response[pos:match.start()])
+            pos = match.end()
+            calls.append((match.group(1), match.group(2)))
+
+        if not calls:
             # No tool calls found, return original response
             return response
-            
-        result_parts = []
-        remaining_response = response
-        
-        for tool_name, args_str in matches:
-            if tool_name in self.tools:
-                try:
-                    # Parse arguments
-                    args = self._parse_tool_arguments(args_str)
-                    
-                    # Execute tool
-                    tool_result = self.tools[tool_name].execute(**args)
-                    result_parts.append(f"Tool {tool_name} result: {tool_result}")
-                    
-                    # Dev mode: log successful tool call
-                    if self.dev_mode.enabled:
-                        self.dev_mode.log_tool_call(tool_name, args, tool_result, success=True)
-                        print(f"🔧 Tool call: {tool_name}({', '.join(f'{k}={v}' for k, v in args.items())})")
-                    
-                    # Remove the tool call from response
-                    tool_call_text = f"TOOL_CALL: {tool_name}({args_str})"
-                    remaining_response = remaining_response.replace(tool_call_text, "").strip()
-                    
-                except Exception as e:
-                    error_msg = f"Error executing {tool_name}: {e}"
-                    result_parts.append(error_msg)
-                    
-                    # Dev mode: log failed tool call
-                    if self.dev_mode.enabled:
-                        args = self._parse_tool_arguments(args_str) if args_str else {}
-                        self.dev_mode.log_tool_call(tool_name, args, "", success=False, error=str(e))
-            else:
-                result_parts.append(f"Unknown tool: {tool_name}")
-        
+
+        text_parts.append(response[pos:])
+
+        result_parts: list[str] = [""] * len(calls)
+
+        parallel_indices: set[int] = set()
+        if self.config.parallel_tools:
+            parallel_indices = {
+                i for i, (name, _) in enumerate(calls)
+                if name in self.READONLY_TOOLS and name in self.tools
+            }
+
+        if len(parallel_indices) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(parallel_indices))) as executor:
+                futures = {
+                    i: executor.submit(self._execute_tool_call, *calls[i])
+                    for i in parallel_indices
+                }
+                for i, future in futures.items():
+                    result_parts[i] = future.result()
+        else:
+            parallel_indices = set()
+
+        # Mutating (and unknown) tools run serially, in call order
+        for i, (tool_name, args_str) in enumerate(calls):
+            if i not in parallel_indices:
+                result_parts[i] = self._execute_tool_call(tool_name, args_str)
+
+        remaining_response = "".join(text_parts).strip()
+
         # Combine remaining response with tool results
-        if remaining_response and remaining_response != response:
+        if remaining_response:
             return f"{remaining_response}\n\n{chr(10).join(result_parts)}"
         else:
             return chr(10).join(result_parts)
 
-    def _parse_tool_arguments(self, args_str: str) -> dict:
-        """Parse tool arguments from string format."""
-        import re
-        
-        args = {}
-        # Parse key="value" patterns
-        arg_pattern = r'(\w+)=(["\'])(.*?)\2'
-        matches = re.findall(arg_pattern, args_str)
-        
-        for key, quote, value in matches:
-            args[key] = value
-            
-        return args
+    def _execute_tool_call(self, tool_name: str, args_str: str) -> str:
+        """Execute a single parsed tool call and format its result.
+
+        Args:
+            tool_name: Name of the tool to invoke
+            args_str: Raw argument text from the tool call
+
+        Returns:
+            Formatted result or error message
+        """
+        if tool_name not in self.tools:
+            return f"Unknown tool: {tool_name}"
+
+        # Parse once; the failure path below reuses the same dict
+        args = self._parse_tool_arguments(args_str) if args_str else {}
+        try:
+            tool_result = self.tools[tool_name].execute(**args)
+        except Exception as e:
+            # Dev mode: log failed tool call
+            if self.dev_mode.enabled:
+                self.dev_mode.log_tool_call(tool_name, args, "", success=False, error=str(e))
+            return f"Error executing {tool_name}: {e}"
+
+        # Dev mode: log successful tool call
+        if self.dev_mode.enabled:
+            self.dev_mode.log_tool_call(tool_name, args, tool_result, success=True)
+            print(f"🔧 Tool call: {tool_name}({', '.join(f'{k}={v}' for k, v in args.items())})")
+
+        return f"Tool {tool_name} result: {tool_result}"
+
+    # Argument parsing needs no instance state; the module-level function
+    # skips the bound-method creation on every tool invocation
+    _parse_tool_arguments = staticmethod(_parse_tool_args)
 
     def _prepare_tool_functions(self) -> list:
         """Convert tool objects to functions that LM Studio can call."""
@@ -267,22 +416,15 @@ Response:"""
 
     def _handle_dev_command(self, command: str) -> None:
         """Handle dev mode commands.
-        
+
         Args:
             command: Dev command starting with !
         """
         cmd = command.lower().strip()
-        
-        if cmd == "!tokens":
-            self._show_token_stats()
-        elif cmd == "!memory":
-            self._show_memory_stats()
-        elif cmd == "!clear":
-            self._clear_short_term_memory()
-        elif cmd == "!stats":
-            self._show_detailed_stats()
-        elif cmd == "!help":
-            self._show_dev_help()
+
+        handler = self._dev_commands.get(cmd)
+        if handler is not None:
+            handler()
         else:
             print(f"Unknown dev command: {command}")
             print("Type !help for available commands")
@@ -290,40 +432,46 @@ Response:"""
     def _show_token_stats(self) -> None:
         """Show current session token statistics."""
         stats = self.dev_mode.get_token_stats()
-        
-        print("🔧 TOKEN STATISTICS")
-        print(f"   Total requests: {stats['total_requests']}")
-        print(f"   Total estimated tokens: {stats['total_estimated_tokens']:,}")
-        print(f"   Average tokens/request: {stats['average_tokens_per_request']:.1f}")
-        print(f"   Session duration: {stats['session_duration_seconds']:.1f} seconds")
-        print(f"   Tokens per minute: {stats['tokens_per_minute']:.1f}")
-        print()
-    
+
+        lines = [
+            "🔧 TOKEN STATISTICS",
+            f"   Total requests: {stats['total_requests']}",
+            f"   Total estimated tokens: {stats['total_estimated_tokens']:,}",
+            f"   Average tokens/request: {stats['average_tokens_per_request']:.1f}",
+            f"   Session duration: {stats['session_duration_seconds']:.1f} seconds",
+            f"   Tokens per minute: {stats['tokens_per_minute']:.1f}",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
     def _show_memory_stats(self) -> None:
         """Show current memory statistics."""
         stats = self.dev_mode.get_memory_stats(
-            self.memory.short_term_memory, 
-            self.memory.long_term_memory
+            self.memory.short_term_memory,
+            self.memory.long_term_memory,
+            self.memory.long_term_json,
         )
-        
-        print("🔧 MEMORY STATISTICS")
-        print(f"   Short-term: {stats['short_term_chars']:,} chars (~{stats['short_term_tokens']} tokens)")
-        print(f"   Long-term: {stats['long_term_entries']} entries, {stats['long_term_chars']:,} chars (~{stats['long_term_tokens']} tokens)")
-        print(f"   Total memory: {stats['total_memory_chars']:,} chars (~{stats['total_memory_tokens']} tokens)")
-        print()
-        
+
+        lines = [
+            "🔧 MEMORY STATISTICS",
+            f"   Short-term: {stats['short_term_chars']:,} chars (~{stats['short_term_tokens']} tokens)",
+            f"   Long-term: {stats['long_term_entries']} entries, {stats['long_term_chars']:,} chars (~{stats['long_term_tokens']} tokens)",
+            f"   Total memory: {stats['total_memory_chars']:,} chars (~{stats['total_memory_tokens']} tokens)",
+            "",
+        ]
+
         # Show memory content preview
         if self.memory.short_term_memory:
             preview = self.memory.short_term_memory[:200] + "..." if len(self.memory.short_term_memory) > 200 else self.memory.short_term_memory
-            print("   Short-term preview:")
-            print(f"   {preview}")
-            print()
-        
+            lines.extend(["   Short-term preview:", f"   {preview}", ""])
+
         if self.memory.long_term_memory:
-            print("   Long-term memory:")
+            lines.append("   Long-term memory:")
             for key, value in self.memory.long_term_memory.items():
-                print(f"   {key}: {value}")
-            print()
+                lines.append(f"   {key}: {value}")
+            lines.append("")
+
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _clear_short_term_memory(self) -> None:
         """Clear short-term memory."""
@@ -337,52 +485,71 @@ Response:"""
         # Get context breakdown
         memory_context = self.memory.get_memory_context()
         breakdown = self.dev_mode.get_context_breakdown(
-            "", memory_context, 
-            self.memory.short_term_memory, 
-            self.memory.long_term_memory
+            "", memory_context,
+            self.memory.short_term_memory,
+            self.memory.long_term_memory,
+            self.memory.long_term_json,
         )
         
         # Get tool stats
         tool_stats = self.dev_mode.get_tool_stats()
-        
-        print("🔧 DETAILED STATISTICS")
-        print()
-        
-        print("CONTEXT BREAKDOWN:")
-        print(f"   Memory context: {breakdown['current_request']['memory_context_chars']:,} chars (~{breakdown['current_request']['memory_context_tokens']} tokens)")
-        print(f"   Short-term: {breakdown['memory_breakdown']['short_term_chars']:,} chars (~{breakdown['memory_breakdown']['short_term_tokens']} tokens)")
-        print(f"   Long-term: {breakdown['memory_breakdown']['long_term_chars']:,} chars (~{breakdown['memory_breakdown']['long_term_tokens']} tokens)")
-        print()
-        
-        print("CONTEXT GROWTH:")
+
         growth = breakdown['context_growth']
-        print(f"   Trend: {growth['trend']}")
-        print(f"   Average growth per request: {growth.get('average_growth_per_request', 0):.1f} chars")
-        print(f"   Current size: {growth.get('current_context_size', 0):,} chars")
-        print(f"   Peak size: {growth.get('peak_context_size', 0):,} chars")
-        print()
-        
-        print("TOOL USAGE:")
-        print(f"   Total calls: {tool_stats['total_tool_calls']}")
-        print(f"   Success rate: {tool_stats['success_rate']:.1%}")
-        print(f"   Successful: {tool_stats['successful_calls']}")
-        print(f"   Failed: {tool_stats['failed_calls']}")
-        
+        lines = [
+            "🔧 DETAILED STATISTICS",
+            "",
+            "CONTEXT BREAKDOWN:",
+            f"   Memory context: {breakdown['current_request']['memory_context_chars']:,} chars (~{breakdown['current_request']['memory_context_tokens']} tokens)",
+            f"   Short-term: {breakdown['memory_breakdown']['short_term_chars']:,} chars (~{breakdown['memory_breakdown']['short_term_tokens']} tokens)",
+            f"   Long-term: {breakdown['memory_breakdown']['long_term_chars']:,} chars (~{breakdown['memory_breakdown']['long_term_tokens']} tokens)",
+            "",
+            "CONTEXT GROWTH:",
+            f"   Trend: {growth['trend']}",
+            f"   Average growth per request: {growth.get('average_growth_per_request', 0):.1f} chars",
+            f"   Current size: {growth.get('current_context_size', 0):,} chars",
+            f"   Peak size: {growth.get('peak_context_size', 0):,} chars",
+            "",
+            "TOOL USAGE:",
+            f"   Total calls: {tool_stats['total_tool_calls']}",
+            f"   Success rate: {tool_stats['success_rate']:.1%}",
+            f"   Successful: {tool_stats['successful_calls']}",
+            f"   Failed: {tool_stats['failed_calls']}",
+        ]
+
         if tool_stats['tool_usage']:
-            print("   Per tool:")
+            lines.append("   Per tool:")
             for tool, usage in tool_stats['tool_usage'].items():
-                print(f"     {tool}: {usage['calls']} calls ({usage['successes']} success, {usage['failures']} failed)")
-        print()
-    
+                lines.append(f"     {tool}: {usage['calls']} calls ({usage['successes']} success, {usage['failures']} failed)")
+        lines.append("")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _show_cache_stats(self) -> None:
+        """Show response cache statistics."""
+        stats = self.sem_cache.stats()
+
+        lines = [
+            "🔧 RESPONSE CACHE",
+            f"   Entries: {stats['entries']}/{stats['max_entries']}",
+            f"   Hits: {stats['hits']}, Misses: {stats['misses']} (hit rate {stats['hit_rate']:.1%})",
+            f"   Normalizer: {stats['normalize_hits']} hits, {stats['normalize_misses']} misses, {stats['normalize_size']} cached",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
     def _show_dev_help(self) -> None:
         """Show available dev commands."""
-        print("🔧 DEV MODE COMMANDS")
-        print("   !tokens  - Show current session token statistics")
-        print("   !memory  - Display current memory state and sizes")
-        print("   !clear   - Clear short-term memory")
-        print("   !stats   - Show detailed context breakdown and analysis")
-        print("   !help    - Show this help message")
-        print()
+        lines = [
+            "🔧 DEV MODE COMMANDS",
+            "   !tokens  - Show current session token statistics",
+            "   !memory  - Display current memory state and sizes",
+            "   !clear   - Clear short-term memory",
+            "   !stats   - Show detailed context breakdown and analysis",
+            "   !cache   - Show response cache hit/miss statistics",
+            "   !help    - Show this help message",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _should_show_prompt(self) -> bool:
         """Ask user if they want to see the full prompt."""
@@ -414,37 +581,62 @@ Response:"""
             print("Defaulting to prompt-based approach")
             return False
 
-    def _is_tool_metadata(self, text: str) -> bool:
+    @staticmethod
+    def _is_tool_metadata(text: str) -> bool:
         """Check if text is tool call metadata that should be filtered out."""
-        return text.startswith("ToolCallRequestData") or text.startswith("ToolCallResultData")
+        return text.startswith(_TOOL_META_PREFIXES)
+
+    async def aprocess_user_input(self, user_input: str) -> None:
+        """Process a single user input without blocking the event loop.
+
+        The lmstudio SDK is synchronous, so the LLM call runs in a worker
+        thread; the event loop stays free for concurrent work.
+
+        Args:
+            user_input: User's input message
+        """
+        await asyncio.to_thread(self.process_user_input, user_input)
 
     def run(self) -> None:
         """Run the main agent interaction loop."""
+        try:
+            asyncio.run(self._arun())
+        except KeyboardInterrupt:
+            print("\nGoodbye!")
+        finally:
+            self.memory.flush()
+            self.sem_cache.save(self._response_cache_path, self.model_key)
+
+    async def _arun(self) -> None:
+        """Async interaction loop; blocking calls are offloaded to threads."""
         # Show dev mode status
         self.dev_mode.print_startup_status()
-        
+
         print("Basic Agent started. Type 'quit' or 'exit' to stop.")
         print("Type your message and press Enter.\n")
 
         while True:
             try:
-                user_input = input("You: ").strip()
+                user_input = (await asyncio.to_thread(input, "You: ")).strip()
 
-                if user_input.lower() in ["quit", "exit", "bye"]:
+                if user_input.lower() in _EXIT_CMDS:
                     print("Goodbye!")
                     break
 
                 if not user_input:
                     continue
 
-                self.process_user_input(user_input)
+                # Dev commands never need memory context or an LLM call;
+                # dispatch them before entering the processing pipeline
+                if self.dev_mode.enabled and user_input.startswith("!"):
+                    self._handle_dev_command(user_input)
+                    continue
+
+                await self.aprocess_user_input(user_input)
                 print()  # Add spacing
 
-            except KeyboardInterrupt:
-                print("\\nGoodbye!")
-                break
             except EOFError:
-                print("\\nGoodbye!")
+                print("\nGoodbye!")
                 break
             except AgentError as e:
                 print(f"Agent error: {e}")
@@ -1,14 +1,19 @@
 """Configuration management for the Basic Agent framework."""
 
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Soft dependency; stdlib json is the fallback
+    orjson = None
+
 from .exceptions import ConfigurationError
 
 
-@dataclass
+@dataclass(frozen=True)
 class ToolConfig:
     """Configuration for a single tool."""
 
@@ -16,6 +21,23 @@ class ToolConfig:
     description: str
 
 
+# Built once at import; the default factory hands out shallow copies
+_DEFAULT_TOOLS: tuple[ToolConfig, ...] = (
+    ToolConfig(
+        "terminal",
+        "Execute terminal/shell commands with smart confirmation for destructive operations",
+    ),
+    ToolConfig("create_file", "Create new files with content"),
+    ToolConfig("read_file", "Read contents of existing files"),
+    ToolConfig("write_file", "Write/overwrite file contents"),
+    ToolConfig(
+        "delete_files", "Safely delete files by moving to trash (not permanent deletion)"
+    ),
+    ToolConfig("list_files", "List files in directories with optional filtering"),
+    ToolConfig("web_search", "Search the web for information"),
+)
+
+
 @dataclass
 class AgentConfig:
     """Agent configuration with validation and type safety."""
@@ -27,6 +49,9 @@ class AgentConfig:
     memory_short_term_cap: int = 10240
     memory_long_term_path: str = "long_term_memory.json"
 
+    # Execution configuration
+    parallel_tools: bool = True
+
     # System configuration
     system_prompt: str = (
         "You are a helpful AI agent with access to tools for file operations, "
@@ -37,22 +62,7 @@ class AgentConfig:
     )
 
     # Tool configuration
-    tools: list[ToolConfig] = field(
-        default_factory=lambda: [
-            ToolConfig(
-                "terminal",
-                "Execute terminal/shell commands with smart confirmation for destructive operations",
-            ),
-            ToolConfig("create_file", "Create new files with content"),
-            ToolConfig("read_file", "Read contents of existing files"),
-            ToolConfig("write_file", "Write/overwrite file contents"),
-            ToolConfig(
-                "delete_files", "Safely delete files by moving to trash (not permanent deletion)"
-            ),
-            ToolConfig("list_files", "List files in directories with optional filtering"),
-            ToolConfig("web_search", "Search the web for information"),
-        ]
-    )
+    tools: list[ToolConfig] = field(default_factory=lambda: list(_DEFAULT_TOOLS))
 
     @classmethod
     def from_file(cls, config_path: str = "config.json") -> "AgentConfig":
@@ -62,8 +72,8 @@ class AgentConfig:
             if not path.exists():
                 raise ConfigurationError(f"Configuration file not found: {config_path}")
 
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            raw = path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             return cls.from_dict(data)
 
@@ -76,15 +86,19 @@ class AgentConfig:
     def from_dict(cls, data: dict[str, Any]) -> "AgentConfig":
         """Create configuration from a dictionary."""
         try:
-            # Convert tools list to ToolConfig objects
-            tools_data = data.get("tools", [])
-            tools = [ToolConfig(**tool) for tool in tools_data]
+            # Pick out known fields only, so configs written by newer
+            # versions still load instead of raising TypeError
+            known = {f.name for f in fields(cls)}
+            kwargs = {k: v for k, v in data.items() if k in known}
 
-            # Create config with tools
-            config_data = data.copy()
-            config_data["tools"] = tools
+            ignored = data.keys() - known
+            if ignored:
+                print(f"Warning: Ignoring unknown configuration keys: {', '.join(sorted(ignored))}")
+
+            # Convert tools list to ToolConfig objects
+            kwargs["tools"] = [ToolConfig(**tool) for tool in kwargs.get("tools", [])]
 
-            return cls(**config_data)
+            return cls(**kwargs)
 
         except TypeError as e:
             raise ConfigurationError(f"Invalid configuration structure: {e}") from e
@@ -95,6 +109,7 @@ class AgentConfig:
             "lm_studio_model": self.lm_studio_model,
             "memory_short_term_cap": self.memory_short_term_cap,
             "memory_long_term_path": self.memory_long_term_path,
+            "parallel_tools": self.parallel_tools,
             "system_prompt": self.system_prompt,
             "tools": [{"name": tool.name, "description": tool.description} for tool in self.tools],
         }
@@ -103,8 +118,11 @@ class AgentConfig:
         """Save configuration to a JSON file."""
         try:
             path = Path(config_path)
-            with path.open("w", encoding="utf-8") as f:
-                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                path.write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+            else:
+                with path.open("w", encoding="utf-8") as f:
+                    json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
         except Exception as e:
             raise ConfigurationError(f"Error saving configuration: {e}") from e
 
@@ -123,8 +141,7 @@ class AgentConfig:
             raise ConfigurationError("At least one tool must be configured")
 
         # Validate tool names are unique
-        tool_names = [tool.name for tool in self.tools]
-        if len(tool_names) != len(set(tool_names)):
+        if len({tool.name for tool in self.tools}) != len(self.tools):
             raise ConfigurationError("Tool names must be unique")
 
 
@@ -3,13 +3,28 @@
 import json
 import os
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Optional
 
+try:
+    import orjson
 
-@dataclass
+    def _dumps(obj: Any) -> str:
+        """Serialize with orjson's native encoder; 3-5x faster than stdlib."""
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:  # Soft dependency; stdlib json is the fallback
+    _dumps = json.dumps
+
+
+@dataclass(slots=True, frozen=True)
 class ContextStats:
-    """Statistics about context usage."""
+    """Statistics about context usage.
+
+    Frozen with slots: one of these is created per request, so instances
+    carry no __dict__ and all fields are set in a single construction.
+    """
     total_chars: int = 0
     estimated_tokens: int = 0
     short_term_chars: int = 0
@@ -18,6 +33,11 @@ class ContextStats:
     memory_context_chars: int = 0
 
 
+# Shared no-op result for disabled trackers: frozen, so one instance can be
+# handed out from every short-circuited call
+_EMPTY_STATS = ContextStats()
+
+
 @dataclass
 class ToolCallLog:
     """Log entry for a tool call."""
@@ -39,22 +59,34 @@ class SessionStats:
     total_tool_calls: int = 0
     successful_tool_calls: int = 0
     failed_tool_calls: int = 0
-    context_history: List[ContextStats] = field(default_factory=list)
-    tool_call_history: List[ToolCallLog] = field(default_factory=list)
+    # Bounded so a long-running session cannot grow these without limit;
+    # aggregate counters above preserve whole-session totals regardless.
+    # Context history keeps only (timestamp, total_chars) per request —
+    # growth analysis needs nothing more, and the tuples are a fraction
+    # of a full ContextStats
+    context_history: Deque[tuple[float, int]] = field(default_factory=lambda: deque(maxlen=1000))
+    tool_call_history: Deque[ToolCallLog] = field(default_factory=lambda: deque(maxlen=1000))
 
 
 class DevModeTracker:
     """Comprehensive development mode observability tracker."""
     
-    def __init__(self, enabled: bool = False):
+    def __init__(self, enabled: bool = False, clock: Callable[[], float] = time.time):
         """Initialize dev mode tracker.
-        
+
         Args:
             enabled: Whether dev mode is active
+            clock: Time source for timestamps and durations; injectable so
+                tests can advance time deterministically
         """
         self.enabled = enabled
-        self.session_stats = SessionStats()
+        self._clock = clock
+        self.session_stats = SessionStats(start_time=clock())
         self._chars_per_token = 4  # Rough estimate
+        # Memoized get_memory_stats result; every field in it derives from
+        # the three lengths in the key, so equal key means equal stats
+        self._memory_stats_key: Optional[tuple] = None
+        self._memory_stats: Dict[str, Any] = {}
         
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count from text length.
@@ -69,35 +101,85 @@ class DevModeTracker:
             return 0
         # Ensure at least 1 token for non-empty text
         return max(1, len(text) // self._chars_per_token)
+
+    def estimate_tokens_from_len(self, length: int) -> int:
+        """Estimate token count when only the text length is known.
+
+        Same heuristic as estimate_tokens, but O(1): callers that already
+        hold lengths never need to materialize or concatenate strings.
+
+        Args:
+            length: Character count of the text
+
+        Returns:
+            Estimated token count
+        """
+        if length <= 0:
+            return 0
+        return max(1, length // self._chars_per_token)
     
-    def analyze_context(self, user_input: str, memory_context: str, 
-                       short_term_memory: str, long_term_memory: Dict[str, Any]) -> ContextStats:
+    def quick_context_stats(self, user_input_len: int, memory_context_len: int) -> ContextStats:
+        """Build per-turn context stats from lengths that are already known.
+
+        Unlike analyze_context, this never serializes long-term memory, so it
+        is cheap enough to run on every turn; the full breakdown stays
+        available for the !stats command.
+
+        Args:
+            user_input_len: Length of the current user input
+            memory_context_len: Length of the memory context string
+
+        Returns:
+            Context statistics with totals only
+        """
+        if not self.enabled:
+            return _EMPTY_STATS
+
+        total = user_input_len + memory_context_len
+        return ContextStats(
+            total_chars=total,
+            estimated_tokens=self.estimate_tokens_from_len(total),
+            base_prompt_chars=user_input_len,
+            memory_context_chars=memory_context_len,
+        )
+
+    def analyze_context(self, user_input: str, memory_context: str,
+                       short_term_memory: str, long_term_memory: Dict[str, Any],
+                       long_term_str: Optional[str] = None) -> ContextStats:
         """Analyze and break down context components.
-        
+
         Args:
             user_input: Current user input
             memory_context: Full memory context string
             short_term_memory: Short-term memory content
             long_term_memory: Long-term memory dictionary
-            
+            long_term_str: Pre-serialized long-term memory, if the caller
+                already has it (avoids re-serializing)
+
         Returns:
             Context statistics breakdown
         """
-        long_term_str = json.dumps(long_term_memory) if long_term_memory else ""
-        
-        stats = ContextStats(
-            short_term_chars=len(short_term_memory),
-            long_term_chars=len(long_term_str),
-            memory_context_chars=len(memory_context),
-            base_prompt_chars=len(user_input)
+        if not self.enabled:
+            return _EMPTY_STATS
+
+        if long_term_str is None:
+            long_term_str = _dumps(long_term_memory) if long_term_memory else ""
+
+        # One C-level pass over the four components; the stats object is
+        # then built in a single construction (no post-init field writes)
+        input_chars, context_chars, short_chars, long_chars = map(
+            len, (user_input, memory_context, short_term_memory, long_term_str)
+        )
+        total = input_chars + context_chars
+
+        return ContextStats(
+            total_chars=total,
+            estimated_tokens=self.estimate_tokens_from_len(total),
+            short_term_chars=short_chars,
+            long_term_chars=long_chars,
+            base_prompt_chars=input_chars,
+            memory_context_chars=context_chars,
         )
-        
-        stats.total_chars = stats.base_prompt_chars + stats.memory_context_chars
-        # Calculate tokens from the actual total text length
-        total_text = user_input + memory_context
-        stats.estimated_tokens = self.estimate_tokens(total_text)
-        
-        return stats
     
     def log_request(self, context_stats: ContextStats) -> None:
         """Log a request with context statistics.
@@ -111,7 +193,7 @@ class DevModeTracker:
         self.session_stats.total_requests += 1
         self.session_stats.total_estimated_tokens += context_stats.estimated_tokens
         self.session_stats.total_prompt_tokens += context_stats.estimated_tokens
-        self.session_stats.context_history.append(context_stats)
+        self.session_stats.context_history.append((self._clock(), context_stats.total_chars))
         
     def log_tool_call(self, tool_name: str, arguments: Dict[str, Any], 
                      result: str, success: bool, error: Optional[str] = None) -> None:
@@ -131,7 +213,7 @@ class DevModeTracker:
         result_preview = result[:200] + "..." if len(result) > 200 else result
         
         tool_log = ToolCallLog(
-            timestamp=time.time(),
+            timestamp=self._clock(),
             tool_name=tool_name,
             arguments=arguments,
             result_preview=result_preview,
@@ -149,7 +231,7 @@ class DevModeTracker:
     
     def get_session_duration(self) -> float:
         """Get session duration in seconds."""
-        return time.time() - self.session_stats.start_time
+        return self._clock() - self.session_stats.start_time
     
     def get_token_stats(self) -> Dict[str, Any]:
         """Get current token usage statistics.
@@ -157,6 +239,9 @@ class DevModeTracker:
         Returns:
             Dictionary with token statistics
         """
+        if not self.enabled:
+            return {}
+
         return {
             "total_requests": self.session_stats.total_requests,
             "total_estimated_tokens": self.session_stats.total_estimated_tokens,
@@ -169,28 +254,41 @@ class DevModeTracker:
             )
         }
     
-    def get_memory_stats(self, short_term_memory: str, 
-                        long_term_memory: Dict[str, Any]) -> Dict[str, Any]:
+    def get_memory_stats(self, short_term_memory: str,
+                        long_term_memory: Dict[str, Any],
+                        long_term_str: Optional[str] = None) -> Dict[str, Any]:
         """Get current memory statistics.
-        
+
         Args:
             short_term_memory: Current short-term memory
             long_term_memory: Current long-term memory
-            
+            long_term_str: Pre-serialized long-term memory, if available
+
         Returns:
             Dictionary with memory statistics
         """
-        long_term_str = json.dumps(long_term_memory) if long_term_memory else ""
-        
-        return {
-            "short_term_chars": len(short_term_memory),
-            "short_term_tokens": self.estimate_tokens(short_term_memory),
-            "long_term_chars": len(long_term_str),
-            "long_term_tokens": self.estimate_tokens(long_term_str),
-            "long_term_entries": len(long_term_memory),
-            "total_memory_chars": len(short_term_memory) + len(long_term_str),
-            "total_memory_tokens": self.estimate_tokens(short_term_memory + long_term_str)
+        if long_term_str is None:
+            long_term_str = _dumps(long_term_memory) if long_term_memory else ""
+
+        short_chars, long_chars = len(short_term_memory), len(long_term_str)
+        key = (short_chars, long_chars, len(long_term_memory))
+        if key == self._memory_stats_key:
+            return self._memory_stats
+
+        # Totals derive from the lengths; no need to concatenate the strings
+        total_chars = short_chars + long_chars
+
+        self._memory_stats_key = key
+        self._memory_stats = {
+            "short_term_chars": short_chars,
+            "short_term_tokens": self.estimate_tokens_from_len(short_chars),
+            "long_term_chars": long_chars,
+            "long_term_tokens": self.estimate_tokens_from_len(long_chars),
+            "long_term_entries": key[2],
+            "total_memory_chars": total_chars,
+            "total_memory_tokens": self.estimate_tokens_from_len(total_chars)
         }
+        return self._memory_stats
     
     def get_tool_stats(self) -> Dict[str, Any]:
         """Get tool call statistics.
@@ -221,20 +319,31 @@ class DevModeTracker:
         }
     
     def get_context_breakdown(self, user_input: str, memory_context: str,
-                            short_term_memory: str, long_term_memory: Dict[str, Any]) -> Dict[str, Any]:
+                            short_term_memory: str, long_term_memory: Dict[str, Any],
+                            long_term_str: Optional[str] = None) -> Dict[str, Any]:
         """Get detailed context breakdown.
-        
+
         Args:
             user_input: Current user input
             memory_context: Full memory context
             short_term_memory: Short-term memory content
             long_term_memory: Long-term memory dictionary
-            
+            long_term_str: Pre-serialized long-term memory, if available
+
         Returns:
             Detailed context analysis
         """
-        stats = self.analyze_context(user_input, memory_context, short_term_memory, long_term_memory)
-        
+        if not self.enabled:
+            return {}
+
+        # Serialize long-term memory once and share it with analyze_context
+        if long_term_str is None:
+            long_term_str = _dumps(long_term_memory) if long_term_memory else ""
+
+        stats = self.analyze_context(
+            user_input, memory_context, short_term_memory, long_term_memory, long_term_str
+        )
+
         return {
             "current_request": {
                 "user_input_chars": len(user_input),
@@ -248,30 +357,30 @@ class DevModeTracker:
                 "short_term_chars": stats.short_term_chars,
                 "short_term_tokens": self.estimate_tokens(short_term_memory),
                 "long_term_chars": stats.long_term_chars,
-                "long_term_tokens": self.estimate_tokens(json.dumps(long_term_memory) if long_term_memory else "")
+                "long_term_tokens": self.estimate_tokens(long_term_str)
             },
             "context_growth": self._analyze_context_growth()
         }
     
     def _analyze_context_growth(self) -> Dict[str, Any]:
         """Analyze context growth patterns over the conversation."""
-        if len(self.session_stats.context_history) < 2:
+        history = self.session_stats.context_history
+        if len(history) < 2:
             return {"trend": "insufficient_data"}
-        
-        recent_contexts = self.session_stats.context_history[-5:]  # Last 5 requests
-        
-        # Calculate growth trend
-        total_chars = [ctx.total_chars for ctx in recent_contexts]
-        if len(total_chars) >= 2:
-            avg_growth = sum(total_chars[i] - total_chars[i-1] for i in range(1, len(total_chars))) / (len(total_chars) - 1)
-        else:
-            avg_growth = 0
-        
+
+        # Average growth over the last 5 requests: consecutive deltas
+        # telescope, so only the window endpoints are needed — no
+        # intermediate per-request lists
+        window_len = min(len(history), 5)
+        first = next(islice(history, len(history) - window_len, None))[1]
+        current = history[-1][1]
+        avg_growth = (current - first) / (window_len - 1)
+
         return {
             "trend": "growing" if avg_growth > 50 else "stable" if avg_growth > -50 else "shrinking",
             "average_growth_per_request": avg_growth,
-            "current_context_size": total_chars[-1] if total_chars else 0,
-            "peak_context_size": max(ctx.total_chars for ctx in self.session_stats.context_history) if self.session_stats.context_history else 0
+            "current_context_size": current,
+            "peak_context_size": max(chars for _, chars in history)
         }
     
     def print_startup_status(self) -> None:
@@ -286,10 +395,22 @@ class DevModeTracker:
             print()
 
 
+# Resolved once at import; the environment doesn't change under a running
+# process, and this check sits on the agent-construction path
+_DEV_MODE_CACHED = os.getenv("DEV_MODE", "").lower() in ("true", "1", "yes", "on")
+
+
+def _refresh_dev_mode() -> bool:
+    """Re-read DEV_MODE from the environment (used by tests that mutate it)."""
+    global _DEV_MODE_CACHED
+    _DEV_MODE_CACHED = os.getenv("DEV_MODE", "").lower() in ("true", "1", "yes", "on")
+    return _DEV_MODE_CACHED
+
+
 def is_dev_mode_enabled() -> bool:
     """Check if dev mode is enabled via environment variable.
-    
+
     Returns:
         True if DEV_MODE environment variable is set to 'true'
     """
-    return os.getenv("DEV_MODE", "").lower() in ("true", "1", "yes", "on")
\ No newline at end of file
+    return _DEV_MODE_CACHED
\ No newline at end of file
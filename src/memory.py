@@ -1,64 +1,206 @@
 """Memory management for the Basic Agent framework."""
 
+import atexit
+import hashlib
 import json
+import mmap
+import os
 import re
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
+
+try:
+    import orjson
+except ImportError:  # Soft dependency; stdlib json is the fallback
+    orjson = None
 
 from .exceptions import MemoryError
 
+# Compiled once at import; runs on every user turn
+_NAME_RE = re.compile(r"my name is (\w+)", re.IGNORECASE)
+
+# Files at or above this size are memory-mapped on load; below it, mmap
+# setup overhead outweighs the saved copy
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _dumps_bytes(data: dict[str, Any]) -> bytes:
+    """Serialize long-term memory to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_bytes(raw: bytes) -> dict[str, Any]:
+    """Parse long-term memory from JSON bytes."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+class MemoryBackend(Protocol):
+    """Storage interface for long-term memory persistence."""
+
+    def exists(self) -> bool: ...
+
+    def load(self) -> dict[str, Any]: ...
+
+    def save(self, data: dict[str, Any]) -> None: ...
+
+    def delete(self) -> None: ...
+
+
+class FileBackend:
+    """Long-term memory persistence backed by a JSON file on disk."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """Initialize with the JSON file path.
+
+        Args:
+            path: Path to the long-term memory JSON file
+        """
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        """Check whether the memory file exists on disk."""
+        return self.path.exists()
+
+    def load(self) -> dict[str, Any]:
+        """Load and parse the memory file.
+
+        Large files are parsed straight from a read-only mapping, avoiding
+        a second full-size bytes copy. Assumes no concurrent writer (saves
+        go through atomic replace, never in-place).
+        """
+        if self.path.stat().st_size >= _MMAP_THRESHOLD:
+            with self.path.open("rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if orjson is not None:
+                        return orjson.loads(memoryview(mm))
+                    return json.loads(mm[:])
+
+        raw = self.path.read_bytes()
+        # Handle empty files gracefully
+        if not raw.strip():
+            return {}
+        return _loads_bytes(raw)
+
+    def save(self, data: dict[str, Any]) -> None:
+        """Serialize and write the memory file atomically.
+
+        Write-then-rename so a crash mid-write cannot corrupt the file.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_dumps_bytes(data))
+        os.replace(tmp_path, self.path)
+
+    def delete(self) -> None:
+        """Remove the memory file if present.
+
+        Catching a missing file avoids the extra stat and the
+        check-then-delete race.
+        """
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class InMemoryBackend:
+    """Long-term memory persistence held entirely in process memory.
+
+    Keeps the save/load serialization round-trip but never touches the
+    filesystem; used by tests in place of tempfile scaffolding.
+    """
+
+    def __init__(self):
+        self._data = b""
+
+    def exists(self) -> bool:
+        """Check whether any memory has been saved."""
+        return bool(self._data)
+
+    def load(self) -> dict[str, Any]:
+        """Parse the stored memory bytes."""
+        if not self._data.strip():
+            return {}
+        return _loads_bytes(self._data)
+
+    def save(self, data: dict[str, Any]) -> None:
+        """Serialize memory into the in-process buffer."""
+        self._data = _dumps_bytes(data)
+
+    def delete(self) -> None:
+        """Discard the stored memory bytes."""
+        self._data = b""
+
 
 class MemoryManager:
     """Manages both short-term and long-term memory for the agent."""
 
-    def __init__(self, long_term_path: str, short_term_cap: int = 10240):
+    def __init__(
+        self,
+        long_term_path: str | None = None,
+        short_term_cap: int = 10240,
+        backend: MemoryBackend | None = None,
+    ):
         """Initialize memory manager.
 
         Args:
             long_term_path: Path to long-term memory JSON file
             short_term_cap: Maximum characters for short-term memory
+            backend: Storage backend for long-term memory; defaults to a
+                FileBackend over long_term_path
         """
-        self.long_term_path = Path(long_term_path)
+        self.backend = backend if backend is not None else FileBackend(long_term_path)
+        self.long_term_path = Path(long_term_path) if long_term_path is not None else None
         self.short_term_cap = short_term_cap
-        self.short_term_memory = ""
+        # Short-term memory is stored as a deque of per-turn strings with a
+        # running length, so appends and truncation are O(turn) instead of
+        # O(cap) string copies; the joined view is materialized lazily
+        self._turns: deque[str] = deque()
+        self._short_len = 0
+        self._short_str: str | None = ""
+        # Existence is tracked here and updated on save/clear, so stats
+        # polling never re-stats the backend
+        self._lt_exists = self.backend.exists()
         self.long_term_memory = self._load_long_term_memory()
+        # Cached JSON serialization of long-term memory; invalidated on mutation
+        # so stats consumers get O(1) reads instead of re-serializing every call
+        self._long_term_str: str | None = None
+        # Writes are deferred: mutations set a dirty flag and flush() persists,
+        # keeping disk I/O out of the per-turn path
+        self._lt_dirty = False
+        atexit.register(self.flush)
 
     def _load_long_term_memory(self) -> dict[str, Any]:
-        """Load long-term memory from JSON file.
+        """Load long-term memory from the storage backend.
 
         Returns:
             Dictionary containing long-term memory data
 
         Raises:
-            MemoryError: If unable to load memory file
+            MemoryError: If unable to load memory
         """
-        if not self.long_term_path.exists():
+        if not self._lt_exists:
             return {}
 
         try:
-            with self.long_term_path.open("r", encoding="utf-8") as f:
-                content = f.read().strip()
-                # Handle empty files gracefully
-                if not content:
-                    return {}
-                return json.loads(content)
+            return self.backend.load()
         except json.JSONDecodeError as e:
             raise MemoryError(f"Corrupted long-term memory file: {e}") from e
         except Exception as e:
             raise MemoryError(f"Failed to load long-term memory: {e}") from e
 
     def save_long_term_memory(self) -> None:
-        """Save long-term memory to JSON file.
+        """Save long-term memory through the storage backend.
 
         Raises:
-            MemoryError: If unable to save memory file
+            MemoryError: If unable to save memory
         """
         try:
-            # Ensure directory exists
-            self.long_term_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with self.long_term_path.open("w", encoding="utf-8") as f:
-                json.dump(self.long_term_memory, f, indent=2, ensure_ascii=False)
+            self.backend.save(self.long_term_memory)
+            self._lt_exists = True
         except Exception as e:
             raise MemoryError(f"Failed to save long-term memory: {e}") from e
 
@@ -71,11 +213,20 @@ class MemoryManager:
         """
         # Update short-term memory
         interaction = f"\nUser: {user_input}\nAgent: {agent_response}"
-        self.short_term_memory += interaction
+        self._turns.append(interaction)
+        self._short_len += len(interaction)
+        self._short_str = None
 
-        # Truncate if too long
-        if len(self.short_term_memory) > self.short_term_cap:
-            self.short_term_memory = self.short_term_memory[-self.short_term_cap :]
+        # Truncate if too long: drop whole turns while the remainder still
+        # overflows, then trim the oldest surviving turn to keep the exact
+        # trailing cap characters (same result as slicing the full string)
+        if self._short_len > self.short_term_cap:
+            while self._turns and self._short_len - len(self._turns[0]) >= self.short_term_cap:
+                self._short_len -= len(self._turns.popleft())
+            excess = self._short_len - self.short_term_cap
+            if excess > 0:
+                self._turns[0] = self._turns[0][excess:]
+                self._short_len = self.short_term_cap
 
         # Extract and store important information
         self._extract_important_info(user_input)
@@ -86,16 +237,58 @@ class MemoryManager:
         Args:
             user_input: User's input to analyze
         """
-        # Remember user's name if mentioned
-        if "my name is" in user_input.lower():
-            name_match = re.search(r"my name is (\\w+)", user_input.lower())
-            if name_match:
-                self.long_term_memory["user_name"] = name_match.group(1).title()
-                self.save_long_term_memory()
+        # Remember user's name if mentioned; IGNORECASE avoids lowercasing
+        # a copy of the input just to test for the phrase
+        name_match = _NAME_RE.search(user_input)
+        if name_match:
+            self.long_term_memory["user_name"] = name_match.group(1).title()
+            self._long_term_str = None
+            self._lt_dirty = True
+
+    def flush(self) -> None:
+        """Write long-term memory to disk if it has unsaved changes."""
+        if self._lt_dirty:
+            self._lt_dirty = False
+            self.save_long_term_memory()
+
+    def search(self, query: str, top_k: int = 5) -> str:
+        """Search stored memory for entries relevant to a query.
+
+        Args:
+            query: Text to look for in memory
+            top_k: Maximum number of long-term entries to return
+
+        Returns:
+            Formatted string of matching memory, or a not-found message
+        """
+        query_lower = query.lower()
+        terms = query_lower.split()
+        matches = []
+
+        for key, value in self.long_term_memory.items():
+            haystack = f"{key}: {value}".lower()
+            if query_lower in haystack or any(term in haystack for term in terms):
+                matches.append(f"- {key}: {value}")
+                if len(matches) >= top_k:
+                    break
+
+        results = []
+        if matches:
+            results.append("Stored facts:\n" + "\n".join(matches))
+
+        if self.short_term_memory and any(term in self.short_term_memory.lower() for term in terms):
+            results.append(f"Recent conversation:{self.short_term_memory}")
+
+        return "\n\n".join(results) if results else f"No stored memory matching '{query}'"
 
     def get_memory_context(self) -> str:
         """Get formatted memory context for LLM.
 
+        The pack is rendered deterministically (entries sorted by key, fixed
+        template) and tagged with a content-hash version header, so identical
+        memory always yields a byte-identical — and therefore cacheable —
+        prompt prefix.
+
         Returns:
             Formatted memory context string
         """
@@ -105,19 +298,59 @@ class MemoryManager:
             context_parts.append(f"Recent conversation: {self.short_term_memory}")
 
         if self.long_term_memory:
-            context_parts.append(f"Important information: {json.dumps(self.long_term_memory)}")
+            facts = "\n".join(f"- {key}: {value}" for key, value in sorted(self.long_term_memory.items()))
+            context_parts.append(f"Important information:\n{facts}")
+
+        if not context_parts:
+            return ""
 
-        return "\n".join(context_parts)
+        pack = "\n".join(context_parts)
+        version = hashlib.md5(pack.encode("utf-8")).hexdigest()[:8]
+        return f"# memory v{version}\n{pack}"
+
+    @property
+    def short_term_memory(self) -> str:
+        """Joined short-term conversation buffer, cached between mutations."""
+        if self._short_str is None:
+            self._short_str = "".join(self._turns)
+        return self._short_str
+
+    @short_term_memory.setter
+    def short_term_memory(self, value: str) -> None:
+        self._turns.clear()
+        if value:
+            self._turns.append(value)
+        self._short_len = len(value)
+        self._short_str = value
 
     def clear_short_term(self) -> None:
         """Clear short-term memory."""
-        self.short_term_memory = ""
+        self._turns.clear()
+        self._short_len = 0
+        self._short_str = ""
 
     def clear_long_term(self) -> None:
-        """Clear long-term memory and delete file."""
+        """Clear long-term memory and delete the stored copy."""
         self.long_term_memory = {}
-        if self.long_term_path.exists():
-            self.long_term_path.unlink()
+        self._long_term_str = None
+        self._lt_dirty = False
+        self.backend.delete()
+        self._lt_exists = False
+
+    @property
+    def long_term_json(self) -> str:
+        """JSON serialization of long-term memory, cached until the next write."""
+        if self._long_term_str is None:
+            self._long_term_str = json.dumps(self.long_term_memory) if self.long_term_memory else ""
+        return self._long_term_str
+
+    def get_cheap_stats(self) -> tuple[int, int, int]:
+        """Get memory sizes without re-serializing anything.
+
+        Returns:
+            Tuple of (short-term chars, long-term serialized chars, long-term entries)
+        """
+        return (self._short_len, len(self.long_term_json), len(self.long_term_memory))
 
     def get_stats(self) -> dict[str, Any]:
         """Get memory usage statistics.
@@ -126,11 +359,11 @@ class MemoryManager:
             Dictionary with memory statistics
         """
         return {
-            "short_term_size": len(self.short_term_memory),
+            "short_term_size": self._short_len,
             "short_term_cap": self.short_term_cap,
             "short_term_usage_pct": round(
-                len(self.short_term_memory) / self.short_term_cap * 100, 1
+                self._short_len / self.short_term_cap * 100, 1
             ),
             "long_term_entries": len(self.long_term_memory),
-            "long_term_file_exists": self.long_term_path.exists(),
+            "long_term_file_exists": self._lt_exists,
         }
@@ -3,12 +3,25 @@
 import json
 import os
 import subprocess
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
-import lmstudio as lms
+if TYPE_CHECKING:
+    import lmstudio as lms
 
 from .exceptions import ModelError
 
+# Cached `lms ls` output with its capture time; the model list rarely
+# changes within a session, and each listing costs a subprocess round-trip
+_MODEL_CACHE: tuple[float, list[dict[str, str]]] | None = None
+_MODEL_CACHE_TTL = 30.0
+
+
+def clear_model_cache() -> None:
+    """Drop the cached model list so the next call re-queries the CLI."""
+    global _MODEL_CACHE
+    _MODEL_CACHE = None
+
 
 def list_available_models() -> list[dict[str, str]]:
     """List available models using LM Studio CLI.
@@ -19,11 +32,17 @@ def list_available_models() -> list[dict[str, str]]:
     Raises:
         ModelError: If unable to list models
     """
+    global _MODEL_CACHE
+
+    if _MODEL_CACHE is not None and time.monotonic() - _MODEL_CACHE[0] < _MODEL_CACHE_TTL:
+        return _MODEL_CACHE[1]
+
     try:
         result = subprocess.run(
             ["lms", "ls", "--json"], capture_output=True, text=True, check=True, timeout=30
         )
         models = json.loads(result.stdout)
+        _MODEL_CACHE = (time.monotonic(), models)
         return models
     except subprocess.CalledProcessError as e:
         raise ModelError(
@@ -146,7 +165,7 @@ def ensure_server_running() -> None:
         raise ModelError("Timeout while managing LM Studio server")
 
 
-def initialize_llm(model_name: str) -> lms.LLM:
+def initialize_llm(model_name: str) -> "lms.LLM":
     """Initialize LM Studio model instance.
 
     Args:
@@ -158,13 +177,17 @@ def initialize_llm(model_name: str) -> lms.LLM:
     Raises:
         ModelError: If model initialization fails
     """
+    # Imported here so CLI-only paths (listing models, server management)
+    # never pay the SDK's import cost
+    import lmstudio as lms
+
     try:
         return lms.llm(model_name)
     except Exception as e:
         raise ModelError(f"Failed to initialize model '{model_name}': {e}") from e
 
 
-def select_and_initialize_model() -> tuple[str, lms.LLM]:
+def select_and_initialize_model() -> "tuple[str, lms.LLM]":
     """Complete model selection and initialization flow.
 
     Returns:
@@ -0,0 +1,153 @@
+"""Response caching to skip LLM calls for repeated or near-identical prompts."""
+
+import json
+import os
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+
+@lru_cache(maxsize=1024)
+def _normalize(text: str) -> str:
+    """Normalize a prompt for matching: casefold and collapse whitespace.
+
+    Memoized because identical prompts recur (repeated questions, stable
+    memory context), making re-normalization pure overhead on every call.
+    """
+    return " ".join(text.casefold().split())
+
+
+class SemanticResponseCache:
+    """Bounded LRU cache mapping prompts to LLM responses.
+
+    Lookup first tries an exact match on the normalized prompt, then falls
+    back to a similarity scan so near-identical phrasings still hit. The
+    similarity check uses stdlib SequenceMatcher rather than embeddings,
+    since this project carries no embedding dependency; on a hit the cache
+    replaces a multi-second LLM inference with an in-process lookup.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 256):
+        """Initialize the cache.
+
+        Args:
+            threshold: Minimum similarity ratio for a fuzzy hit
+            max_entries: Maximum number of cached responses before LRU eviction
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def lookup(self, prompt: str) -> str | None:
+        """Return a cached response for the prompt, or None on a miss.
+
+        Args:
+            prompt: Full prompt text (input plus any context)
+
+        Returns:
+            Cached response string, or None
+        """
+        key = _normalize(prompt)
+
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+        # Fuzzy fallback: scan from most recently used. SequenceMatcher caches
+        # analysis of its second sequence, so the query goes there.
+        matcher = SequenceMatcher(b=key, autojunk=False)
+        for cached_key in reversed(self._entries):
+            matcher.set_seq1(cached_key)
+            if (
+                matcher.real_quick_ratio() >= self.threshold
+                and matcher.quick_ratio() >= self.threshold
+                and matcher.ratio() >= self.threshold
+            ):
+                self._entries.move_to_end(cached_key)
+                self.hits += 1
+                return self._entries[cached_key]
+
+        self.misses += 1
+        return None
+
+    def put(self, prompt: str, response: str) -> None:
+        """Store a response, evicting the least recently used entry when full.
+
+        Args:
+            prompt: Full prompt text the response was generated for
+            response: LLM response to cache
+        """
+        key = _normalize(prompt)
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache usage statistics.
+
+        Returns:
+            Dictionary with entry count, hit/miss counts, and hit rate
+        """
+        total = self.hits + self.misses
+        normalize_info = _normalize.cache_info()
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "normalize_hits": normalize_info.hits,
+            "normalize_misses": normalize_info.misses,
+            "normalize_size": normalize_info.currsize,
+        }
+
+    def load(self, path: Path, version: str) -> None:
+        """Load persisted entries if the stored version tag matches.
+
+        Args:
+            path: Cache file location
+            version: Version tag (e.g. model key); mismatches start empty
+        """
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError, ValueError):
+            return
+
+        if data.get("version") != version:
+            return
+
+        for entry in data.get("entries", []):
+            if isinstance(entry, list) and len(entry) == 2:
+                self._entries[entry[0]] = entry[1]
+
+    def save(self, path: Path, version: str) -> None:
+        """Persist entries atomically, tagged with a version string.
+
+        Args:
+            path: Cache file location
+            version: Version tag stored alongside the entries
+        """
+        if not self._entries:
+            return
+
+        data = {
+            "version": version,
+            "entries": [[k, v] for k, v in self._entries.items()],
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".json.tmp")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # Cache persistence is best-effort
@@ -1,5 +1,7 @@
 """Tool system for the Basic Agent framework."""
 
+from collections.abc import Iterator, Mapping
+
 from .base import Tool
 from .file_operations import (
     CreateFileTool,
@@ -8,19 +10,48 @@ from .file_operations import (
     ReadFileTool,
     WriteFileTool,
 )
+from .memory_recall import RecallMemoryTool
 from .terminal import TerminalTool
 from .web_search import WebSearchTool
 
+
+class _LazyToolRegistry(Mapping):
+    """Read-only tool registry that instantiates tools on first access.
+
+    Importing the package no longer constructs every tool; instances are
+    created when first looked up and cached for the process lifetime.
+    """
+
+    def __init__(self, factories: dict[str, type[Tool]]):
+        self._factories = factories
+        self._instances: dict[str, Tool] = {}
+
+    def __getitem__(self, name: str) -> Tool:
+        tool = self._instances.get(name)
+        if tool is None:
+            tool = self._factories[name]()
+            self._instances[name] = tool
+        return tool
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+
 # Tool registry for easy access
-AVAILABLE_TOOLS = {
-    "terminal": TerminalTool(),
-    "create_file": CreateFileTool(),
-    "read_file": ReadFileTool(),
-    "write_file": WriteFileTool(),
-    "delete_files": DeleteFilesTool(),
-    "list_files": ListFilesTool(),
-    "web_search": WebSearchTool(),
-}
+AVAILABLE_TOOLS = _LazyToolRegistry(
+    {
+        "terminal": TerminalTool,
+        "create_file": CreateFileTool,
+        "read_file": ReadFileTool,
+        "write_file": WriteFileTool,
+        "delete_files": DeleteFilesTool,
+        "list_files": ListFilesTool,
+        "web_search": WebSearchTool,
+    }
+)
 
 __all__ = [
     "Tool",
@@ -30,6 +61,7 @@ __all__ = [
     "WriteFileTool",
     "DeleteFilesTool",
     "ListFilesTool",
+    "RecallMemoryTool",
     "WebSearchTool",
     "AVAILABLE_TOOLS",
 ]
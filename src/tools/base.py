@@ -1,23 +1,25 @@
 """Base classes for the tool system."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 
 class Tool(ABC):
-    """Abstract base class for all agent tools."""
+    """Abstract base class for all agent tools.
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Tool name for identification."""
-        pass
+    Subclasses declare ``name`` and ``description`` as plain class
+    attributes (identity and catalog text are fixed per class, so a
+    property indirection per access is wasted work) and define
+    ``__slots__`` so instances carry no per-object dict.
+    """
 
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Tool description for the LLM."""
-        pass
+    __slots__ = ()
+
+    # Tool name for identification
+    name: ClassVar[str]
+
+    # Tool description for the LLM
+    description: ClassVar[str]
 
     @abstractmethod
     def execute(self, **kwargs: Any) -> str:
@@ -1,14 +1,64 @@
 """File operation tools with safety features."""
 
+import errno
+import glob
+import os
 import platform
+import shlex
 import shutil
 import subprocess
+import time
+import uuid
 from pathlib import Path
 
 from ..exceptions import ToolError
 from .base import Tool
 
 
+def _find_matching_files(path_pattern: str, older_than_days: int | None = None) -> list[str]:
+    """Find files matching a glob pattern, optionally filtered by age.
+
+    Directories matched by the pattern are walked recursively with an
+    explicit scandir stack, so no shell or find subprocess is needed and
+    mtime comes from the dirent stat already in hand.
+
+    Args:
+        path_pattern: Glob pattern or directory path to search
+        older_than_days: Only include files older than this many days
+
+    Returns:
+        List of matching file paths
+    """
+    cutoff = time.time() - older_than_days * 86400 if older_than_days else None
+    matches: list[str] = []
+
+    def _want(st_mtime: float) -> bool:
+        return cutoff is None or st_mtime < cutoff
+
+    for match in glob.glob(os.path.expanduser(path_pattern)):
+        if os.path.isfile(match):
+            if _want(os.stat(match).st_mtime):
+                matches.append(match)
+            continue
+
+        stack = [match]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False) and _want(
+                            entry.stat(follow_symlinks=False).st_mtime
+                        ):
+                            matches.append(entry.path)
+            except (PermissionError, FileNotFoundError):
+                continue  # Skip unreadable or vanished directories
+
+    return matches
+
+
 def safe_delete_files(file_pattern: str) -> str:
     """Safely delete files by moving them to trash instead of permanent deletion.
 
@@ -22,15 +72,14 @@ def safe_delete_files(file_pattern: str) -> str:
         ToolError: If deletion fails
     """
     try:
-        # First, find the files that match the pattern
-        find_cmd = f"find {file_pattern} 2>/dev/null"
-        result = subprocess.run(find_cmd, shell=True, capture_output=True, text=True, timeout=30)
-
-        if result.returncode != 0:
-            return f"No files found matching pattern: {file_pattern}"
-
-        files = result.stdout.strip().split("\\n") if result.stdout.strip() else []
-        files = [f for f in files if f.strip()]  # Remove empty lines
+        # Run find directly (no shell) and stream its output line by line
+        # instead of buffering all of stdout before splitting
+        find_cmd = ["find", *shlex.split(file_pattern)]
+        with subprocess.Popen(
+            find_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        ) as proc:
+            files = [line.rstrip("\n") for line in proc.stdout if line.strip()]
+            proc.wait(timeout=30)
 
         if not files:
             return f"No files found matching pattern: {file_pattern}"
@@ -52,22 +101,44 @@ def safe_delete_files(file_pattern: str) -> str:
 def _move_to_trash_macos(files: list[str]) -> int:
     """Move files to trash on macOS."""
     # Check if trash command exists
-    check_trash = subprocess.run("which trash", shell=True, capture_output=True, text=True)
-
-    if check_trash.returncode == 0:
-        # Use trash command
-        for file_path in files:
-            subprocess.run(f"trash '{file_path}'", shell=True, capture_output=True, text=True)
-        return len(files)
-    else:
-        # Use native macOS trash
-        moved_count = 0
-        for file_path in files:
-            mv_cmd = f"mv '{file_path}' ~/.Trash/"
-            mv_result = subprocess.run(mv_cmd, shell=True, capture_output=True, text=True)
-            if mv_result.returncode == 0:
-                moved_count += 1
-        return moved_count
+    if shutil.which("trash"):
+        # One batched trash invocation instead of a subprocess per file;
+        # argv form also sidesteps shell quoting of odd filenames
+        result = subprocess.run(["trash", *files], capture_output=True, text=True)
+        if result.returncode == 0:
+            return len(files)
+
+    # Fall back to moving into ~/.Trash in-process
+    trash_dir = Path.home() / ".Trash"
+    moved_count = 0
+    for file_path in files:
+        try:
+            shutil.move(file_path, trash_dir / Path(file_path).name)
+            moved_count += 1
+        except Exception:
+            continue  # Skip files that can't be moved
+    return moved_count
+
+
+def _move_file(source: str, target: Path) -> None:
+    """Move a file, preferring a single rename syscall.
+
+    Cross-filesystem moves (EXDEV) fall back to os.copy_file_range, which
+    copies in-kernel — reflink on supporting filesystems — instead of
+    looping a userspace buffer, then unlink the source.
+    """
+    try:
+        os.rename(source, target)
+        return
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.ENOSYS):
+            raise
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        in_fd, out_fd = src.fileno(), dst.fileno()
+        while os.copy_file_range(in_fd, out_fd, 2**20):
+            pass
+    os.unlink(source)
 
 
 def _move_to_trash_linux(files: list[str]) -> int:
@@ -81,15 +152,14 @@ def _move_to_trash_linux(files: list[str]) -> int:
             filename = Path(file_path).name
             target_path = trash_dir / filename
 
-            # Handle name conflicts
-            counter = 1
-            while target_path.exists():
-                stem = Path(filename).stem
-                suffix = Path(filename).suffix
-                target_path = trash_dir / f"{stem}_{counter}{suffix}"
-                counter += 1
+            # Handle name conflicts: one exists() check plus a random
+            # suffix, instead of probing numbered candidates one by one
+            if target_path.exists():
+                source = Path(filename)
+                unique = uuid.uuid4().hex[:8]
+                target_path = trash_dir / f"{source.stem}_{unique}{source.suffix}"
 
-            shutil.move(file_path, target_path)
+            _move_file(file_path, target_path)
             moved_count += 1
         except Exception:
             continue  # Skip files that can't be moved
@@ -100,13 +170,10 @@ def _move_to_trash_linux(files: list[str]) -> int:
 class CreateFileTool(Tool):
     """Create new files with content."""
 
-    @property
-    def name(self) -> str:
-        return "create_file"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Create new files with content"
+    name = "create_file"
+    description = "Create new files with content"
 
     def execute(self, path: str, content: str = "") -> str:
         """Create a new file with the given content.
@@ -122,8 +189,7 @@ class CreateFileTool(Tool):
             file_path = Path(path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with file_path.open("w", encoding="utf-8") as f:
-                f.write(content)
+            file_path.write_bytes(content.encode("utf-8"))
 
             return f"File {path} created successfully"
         except PermissionError:
@@ -135,19 +201,17 @@ class CreateFileTool(Tool):
 class ReadFileTool(Tool):
     """Read the contents of existing files."""
 
-    @property
-    def name(self) -> str:
-        return "read_file"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Read contents of existing files"
+    name = "read_file"
+    description = "Read contents of existing files"
 
-    def execute(self, path: str) -> str:
+    def execute(self, path: str, max_bytes: int = 1_048_576) -> str:
         """Read the contents of a file.
 
         Args:
             path: File path to read
+            max_bytes: Maximum bytes to read; larger files are truncated
 
         Returns:
             File contents or error message
@@ -158,14 +222,24 @@ class ReadFileTool(Tool):
             if not file_path.exists():
                 raise ToolError(f"File {path} not found")
 
-            with file_path.open("r", encoding="utf-8") as f:
-                content = f.read()
+            # Read at most max_bytes so a huge file cannot blow up the
+            # context; one extra byte tells us whether we truncated
+            with file_path.open("rb") as f:
+                data = f.read(max_bytes)
+                truncated = bool(f.read(1))
+
+            if b"\x00" in data:
+                raise ToolError(f"Cannot read {path}: file appears to be binary")
+
+            content = data.decode("utf-8", errors="replace")
+            if truncated:
+                content += f"\n... [truncated at {max_bytes} bytes]"
 
             return content if content else "File is empty"
+        except ToolError:
+            raise
         except PermissionError:
             raise ToolError(f"Permission denied reading {path}")
-        except UnicodeDecodeError:
-            raise ToolError(f"Cannot read {path}: file appears to be binary")
         except Exception as e:
             raise ToolError(f"Error reading file {path}: {e}")
 
@@ -173,13 +247,10 @@ class ReadFileTool(Tool):
 class WriteFileTool(Tool):
     """Write content to files (overwrites existing content)."""
 
-    @property
-    def name(self) -> str:
-        return "write_file"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Write/overwrite file contents"
+    name = "write_file"
+    description = "Write/overwrite file contents"
 
     def execute(self, path: str, content: str) -> str:
         """Write content to a file (overwrites existing content).
@@ -195,8 +266,7 @@ class WriteFileTool(Tool):
             file_path = Path(path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with file_path.open("w", encoding="utf-8") as f:
-                f.write(content)
+            file_path.write_bytes(content.encode("utf-8"))
 
             return f"Content written to {path} successfully"
         except PermissionError:
@@ -208,13 +278,10 @@ class WriteFileTool(Tool):
 class DeleteFilesTool(Tool):
     """Safely delete files by moving to trash."""
 
-    @property
-    def name(self) -> str:
-        return "delete_files"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Safely delete files by moving to trash (not permanent deletion)"
+    name = "delete_files"
+    description = "Safely delete files by moving to trash (not permanent deletion)"
 
     def execute(self, path_pattern: str, older_than_days: int | None = None) -> str:
         """Safely delete files by moving them to trash.
@@ -227,13 +294,17 @@ class DeleteFilesTool(Tool):
             Status message about deletion
         """
         try:
-            # Build find command based on parameters
-            if older_than_days:
-                find_pattern = f"{path_pattern} -type f -mtime +{older_than_days}"
-            else:
-                find_pattern = f"{path_pattern} -type f"
+            files = _find_matching_files(path_pattern, older_than_days)
+
+            if not files:
+                return f"No files found matching pattern: {path_pattern}"
 
-            return safe_delete_files(find_pattern)
+            if platform.system() == "Darwin":  # macOS
+                moved_count = _move_to_trash_macos(files)
+            else:  # Linux/other
+                moved_count = _move_to_trash_linux(files)
+
+            return f"Moved {moved_count} file(s) to Trash"
         except Exception as e:
             raise ToolError(f"Error deleting files: {e}")
 
@@ -241,13 +312,10 @@ class DeleteFilesTool(Tool):
 class ListFilesTool(Tool):
     """List files in directories with optional filtering."""
 
-    @property
-    def name(self) -> str:
-        return "list_files"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "List files in directories with optional filtering"
+    name = "list_files"
+    description = "List files in directories with optional filtering"
 
     def execute(self, path: str, pattern: str | None = None, show_hidden: bool = False) -> str:
         """List files in a directory with optional filtering.
@@ -261,23 +329,30 @@ class ListFilesTool(Tool):
             File listing or error message
         """
         try:
+            dir_path = Path(path)
+            if not dir_path.is_dir():
+                raise ToolError(f"Directory {path} not found")
+
             if pattern:
-                cmd = f"find '{path}' -name '{pattern}' -type f"
-            else:
-                if show_hidden:
-                    cmd = f"ls -la '{path}'"
-                else:
-                    cmd = f"ls -l '{path}'"
-
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                return output if output else "No files found"
-            else:
-                raise ToolError(f"Error listing files: {result.stderr.strip()}")
-
-        except subprocess.TimeoutExpired:
-            raise ToolError("Timeout while listing files")
+                # Recursive pattern search, matching the old find behavior
+                matches = sorted(str(p) for p in dir_path.rglob(pattern) if p.is_file())
+                return "\n".join(matches) if matches else "No files found"
+
+            # Plain listing via scandir: one syscall batch, no shell fork
+            lines = []
+            with os.scandir(dir_path) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if not show_hidden and entry.name.startswith("."):
+                        continue
+                    kind = "d" if entry.is_dir(follow_symlinks=False) else "-"
+                    size = entry.stat(follow_symlinks=False).st_size
+                    lines.append(f"{kind} {size:>10} {entry.name}")
+
+            return "\n".join(lines) if lines else "No files found"
+
+        except ToolError:
+            raise
+        except PermissionError:
+            raise ToolError(f"Permission denied listing {path}")
         except Exception as e:
             raise ToolError(f"Error listing files: {e}")
@@ -0,0 +1,36 @@
+"""Memory recall tool for on-demand retrieval instead of inline prompt injection."""
+
+from ..memory import MemoryManager
+from .base import Tool
+
+
+class RecallMemoryTool(Tool):
+    """Retrieve relevant stored memory on demand.
+
+    Registered per-agent (not in the global registry) because it needs
+    the agent's MemoryManager instance.
+    """
+
+    __slots__ = ("_memory",)
+
+    name = "recall_memory"
+    description = "Recall stored facts and recent conversation relevant to a query"
+
+    def __init__(self, memory: MemoryManager):
+        """Initialize with the agent's memory manager.
+
+        Args:
+            memory: Memory manager to search
+        """
+        self._memory = memory
+
+    def execute(self, query: str) -> str:
+        """Search memory for entries relevant to the query.
+
+        Args:
+            query: What to look for in memory
+
+        Returns:
+            Matching memory entries or a not-found message
+        """
+        return self._memory.search(query)
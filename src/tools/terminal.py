@@ -6,17 +6,74 @@ import subprocess
 from ..exceptions import ToolError, UserCancellationError
 from .base import Tool
 
+# Safety checks run on every terminal invocation; the substring lists are
+# compiled once into alternation regexes instead of scanning per pattern.
+# A single regex pass is one C-level scan regardless of pattern count.
+_DESTRUCTIVE_RE = re.compile(
+    "|".join(
+        re.escape(pattern)
+        for pattern in (
+            "rm ",
+            "rm\t",
+            "rmdir",
+            "mv ",
+            "mv\t",
+            "dd ",
+            "dd\t",
+            "shred",
+            "wipe",
+            "format",
+            "mkfs",
+            "> ",
+            ">\t",
+            "truncate",
+            "chown",
+            "chmod 000",
+            "chmod 777",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+_HIGH_RISK_RE = re.compile(
+    "|".join(
+        re.escape(pattern)
+        for pattern in (
+            "rm -rf /",
+            "rm -rf *",
+            "dd if=",
+            "mkfs",
+            "format",
+            "shred",
+            "chmod 777",
+            "chmod 000",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+_MEDIUM_RISK_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in ("rm -rf", "rm -r", "rmdir", "mv ", "rm ")),
+    re.IGNORECASE,
+)
+
+# First letters of the destructive tokens (both cases, plus '>'); a command
+# containing none of these cannot match _DESTRUCTIVE_RE, so one C-level
+# disjointness check screens out benign commands before the regex runs
+_TRIPWIRE = frozenset("rmdswftc>RMDSWFTC")
+
+_FIND_RM_RE = re.compile(
+    r'find\s+([^\s]+).*?-name\s+["\']([^"\']+)["\'].*?-mtime\s+\+(\d+)'
+)
+
 
 class TerminalTool(Tool):
     """Execute terminal commands with safety features."""
 
-    @property
-    def name(self) -> str:
-        return "terminal"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Execute terminal/shell commands with smart confirmation for destructive operations"
+    name = "terminal"
+    description = "Execute terminal/shell commands with smart confirmation for destructive operations"
 
     def execute(self, command: str) -> str:
         """Execute a terminal command with safety checks.
@@ -38,53 +95,17 @@ class TerminalTool(Tool):
 
     def _is_destructive_command(self, command: str) -> bool:
         """Check if a command is potentially destructive."""
-        destructive_patterns = [
-            "rm ",
-            "rm\\t",
-            "rmdir",
-            "mv ",
-            "mv\\t",
-            "dd ",
-            "dd\\t",
-            "shred",
-            "wipe",
-            "format",
-            "mkfs",
-            "> ",
-            ">\\t",
-            "truncate",
-            "chown",
-            "chmod 000",
-            "chmod 777",
-        ]
-
-        command_lower = command.lower().strip()
-        return any(pattern in command_lower for pattern in destructive_patterns)
+        if _TRIPWIRE.isdisjoint(command):
+            return False
+        return _DESTRUCTIVE_RE.search(command) is not None
 
     def _classify_command_risk(self, command: str) -> str:
         """Classify the risk level of a destructive command."""
-        command_lower = command.lower()
+        if _HIGH_RISK_RE.search(command):
+            return "high"
 
-        high_risk = [
-            "rm -rf /",
-            "rm -rf *",
-            "dd if=",
-            "mkfs",
-            "format",
-            "shred",
-            "chmod 777",
-            "chmod 000",
-        ]
-
-        medium_risk = ["rm -rf", "rm -r", "rmdir", "mv ", "rm "]
-
-        for pattern in high_risk:
-            if pattern in command_lower:
-                return "high"
-
-        for pattern in medium_risk:
-            if pattern in command_lower:
-                return "medium"
+        if _MEDIUM_RISK_RE.search(command):
+            return "medium"
 
         return "low"
 
@@ -123,9 +144,10 @@ class TerminalTool(Tool):
         print("\\nCommand breakdown:")
         print(f"  Full command: {command}")
 
-        if "rm" in command.lower():
+        command_lower = command.lower()
+        if "rm" in command_lower:
             print("  - Contains 'rm': Will delete files/directories")
-        if "mv" in command.lower():
+        if "mv" in command_lower:
             print("  - Contains 'mv': Will move/rename files (can overwrite)")
         if "-r" in command or "-rf" in command:
             print("  - Recursive flag: Will affect directories and all contents")
@@ -149,9 +171,7 @@ class TerminalTool(Tool):
         """Handle find...rm patterns with safer alternatives."""
         try:
             # Parse find command to extract pattern
-            find_match = re.search(
-                r'find\s+([^\s]+).*?-name\s+["\']([^"\']+)["\'].*?-mtime\s+\+(\d+)', command
-            )
+            find_match = _FIND_RM_RE.search(command)
 
             if find_match:
                 search_path = find_match.group(1)
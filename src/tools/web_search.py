@@ -6,13 +6,10 @@ from .base import Tool
 class WebSearchTool(Tool):
     """Search the web for information (placeholder for future implementation)."""
 
-    @property
-    def name(self) -> str:
-        return "web_search"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Search the web for information"
+    name = "web_search"
+    description = "Search the web for information"
 
     def execute(self, query: str) -> str:
         """Search the web for information.
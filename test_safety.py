@@ -3,7 +3,25 @@
 
 import tempfile
 import os
-import subprocess
+
+# Fixture data is constant across runs; frozen at import as tuples so each
+# test invocation just loads a global instead of rebuilding a list
+DESTRUCTIVE_COMMANDS = (
+    ("rm -rf /tmp/test", "medium"),
+    ("mv file1 file2", "medium"),
+    ("dd if=/dev/zero of=/tmp/test", "high"),
+    ("chmod 777 /etc/passwd", "high"),
+    ("rm -rf /", "high"),
+    ("rm file.txt", "low"),
+)
+
+SAFE_COMMANDS = ("ls -la", "cat /etc/hosts", "echo hello", "ps aux")
+
+RISK_COMMANDS = (
+    ("rm -rf /important/data", "high"),
+    ("rm temp.txt", "low"),
+    ("mv oldfile newfile", "medium"),
+)
 
 
 def test_safe_delete():
@@ -31,10 +49,16 @@ def test_safe_delete():
     else:
         print("❌ File still exists in original location")
 
-    # Check if file is in trash (macOS)
-    if os.path.exists(os.path.expanduser("~/.Trash")):
-        trash_contents = subprocess.run("ls ~/.Trash/", shell=True, capture_output=True, text=True)
-        if os.path.basename(test_file) in trash_contents.stdout:
+    # Check if file is in trash (macOS); scandir lists the directory in-process
+    # instead of forking a shell just to parse ls output
+    basename = os.path.basename(test_file)
+    try:
+        with os.scandir(os.path.expanduser("~/.Trash")) as entries:
+            found = any(entry.name == basename for entry in entries)
+    except FileNotFoundError:
+        pass  # No ~/.Trash on this system (non-macOS)
+    else:
+        if found:
             print("✅ File found in Trash")
         else:
             print("❌ File not found in Trash")
@@ -44,19 +68,8 @@ def test_destructive_command_detection():
     """Test that destructive commands are properly detected and classified"""
     from main import is_destructive_command, classify_command_risk
 
-    destructive_commands = [
-        ("rm -rf /tmp/test", "medium"),
-        ("mv file1 file2", "medium"),
-        ("dd if=/dev/zero of=/tmp/test", "high"),
-        ("chmod 777 /etc/passwd", "high"),
-        ("rm -rf /", "high"),
-        ("rm file.txt", "low"),
-    ]
-
-    safe_commands = ["ls -la", "cat /etc/hosts", "echo hello", "ps aux"]
-
     print("\nTesting destructive command detection and risk classification:")
-    for cmd, expected_risk in destructive_commands:
+    for cmd, expected_risk in DESTRUCTIVE_COMMANDS:
         is_destructive = is_destructive_command(cmd)
         actual_risk = classify_command_risk(cmd) if is_destructive else "safe"
 
@@ -66,7 +79,7 @@ def test_destructive_command_detection():
             print(f"❌ Misclassified: {cmd} -> expected {expected_risk}, got {actual_risk}")
 
     print("\nTesting safe command detection:")
-    for cmd in safe_commands:
+    for cmd in SAFE_COMMANDS:
         if not is_destructive_command(cmd):
             print(f"✅ Correctly identified as safe: {cmd}")
         else:
@@ -77,14 +90,8 @@ def test_confirmation_system_mock():
     """Test confirmation system with mocked input (non-interactive)"""
     from main import classify_command_risk
 
-    test_commands = [
-        ("rm -rf /important/data", "high"),
-        ("rm temp.txt", "low"),
-        ("mv oldfile newfile", "medium"),
-    ]
-
     print("\nTesting risk classification system:")
-    for cmd, expected_risk in test_commands:
+    for cmd, expected_risk in RISK_COMMANDS:
         actual_risk = classify_command_risk(cmd)
         if actual_risk == expected_risk:
             print(f"✅ Risk classification correct: '{cmd}' -> {actual_risk}")
@@ -0,0 +1,23 @@
+"""Shared pytest fixtures for the test suite."""
+
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def mocked_agent_deps(monkeypatch):
+    """Stub out the agent's model and memory dependencies.
+
+    monkeypatch swaps the attributes directly, skipping the dotted-path
+    resolution and save/restore bookkeeping unittest.mock.patch repeats
+    on every context-manager entry.
+
+    Yields:
+        Mock standing in for get_model_info (reports a non-tool-use model)
+    """
+    mock_info = Mock(return_value={"trainedForToolUse": False})
+    # BasicAgent imports both names into its own namespace, so patch there
+    monkeypatch.setattr("src.agent.get_model_info", mock_info)
+    monkeypatch.setattr("src.agent.MemoryManager", Mock())
+    yield mock_info
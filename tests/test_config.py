@@ -0,0 +1,38 @@
+"""Test configuration dataclasses; no mocks needed."""
+
+import pytest
+from src.config import AgentConfig, ToolConfig
+from src.exceptions import ConfigurationError
+
+
+def test_tool_config():
+    """Test ToolConfig dataclass."""
+    tool = ToolConfig("test_tool", "A test tool")
+    assert tool.name == "test_tool"
+    assert tool.description == "A test tool"
+
+
+def test_agent_config_defaults():
+    """Test AgentConfig with default values."""
+    config = AgentConfig()
+    assert config.lm_studio_model is None
+    assert config.memory_short_term_cap == 10240
+    assert config.memory_long_term_path == "long_term_memory.json"
+    assert len(config.tools) == 7  # Default tools
+
+
+def test_agent_config_validation():
+    """Test AgentConfig validation."""
+    config = AgentConfig()
+    config.validate()  # Should not raise
+
+    # Test invalid memory cap
+    config.memory_short_term_cap = -1
+    with pytest.raises(ConfigurationError):
+        config.validate()
+
+    # Test empty path
+    config.memory_short_term_cap = 1000
+    config.memory_long_term_path = ""
+    with pytest.raises(ConfigurationError):
+        config.validate()